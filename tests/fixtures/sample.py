@@ -4,60 +4,163 @@ Sample data processing module for testing.
 Reads a CSV-like file and computes statistics.
 """
 
+import csv
+import math
 import sys
-from typing import Dict, List, Tuple
+from collections import defaultdict
+from typing import DefaultDict, Dict, Iterator, List, Sequence, Tuple
 
+try:
+    import pandas as pd
+except ImportError:  # pandas is optional; fall back to the pure-Python parser
+    pd = None
 
-def read_data_file(filepath: str) -> List[Dict[str, str]]:
-    """Read data from a CSV-like file and return as list of dictionaries."""
-    records = []
+
+def _column_positions(headers: List[str]) -> Dict[str, List[int]]:
+    """
+    Map each distinct header to the indices of its fields, last occurrence first.
+    
+    Combined with _pick_value, a repeated header takes the value of its last
+    occurrence present in the row while keeping the position of its first,
+    matching dict(zip(headers, values)) on the unpadded row.
+    """
+    positions: Dict[str, List[int]] = {}
+    for i, header in enumerate(headers):
+        positions.setdefault(header, []).insert(0, i)
+    return positions
+
+
+def _pick_value(values: List[str], indices: List[int]) -> str:
+    """Return the value at the first index the row is long enough to hold, or ''."""
+    for i in indices:
+        if i < len(values):
+            return values[i]
+    return ''
+
+
+def _read_with_pandas(filepath: str, headers: List[str]) -> Dict[str, List[str]]:
+    """Parse the data rows with pandas' C tokenizer, keeping every value as a string."""
+    if not headers:
+        return {}
+    fields = list(range(len(headers)))
+    options = dict(header=None, skiprows=1, names=fields, index_col=False,
+                   skipinitialspace=True, dtype=str, keep_default_na=False)
+    try:
+        # Positional names plus usecols make pandas drop extra fields and pad
+        # short rows like the pure-Python parser, instead of raising or moving
+        # leading columns into the index.
+        df = pd.read_csv(filepath, usecols=fields, **options)
+    except pd.errors.ParserError as e:
+        # usecols is rejected when no row is as wide as the header; then there
+        # are no extra fields to drop and names alone pads the short rows.
+        if 'Too many columns specified' not in str(e):
+            raise
+        df = pd.read_csv(filepath, **options)
+    return {header: df[i].str.strip().tolist() for header, i in zip(headers, fields)}
+
+
+def _read_with_csv(reader: Iterator[List[str]], headers: List[str]) -> Dict[str, List[str]]:
+    """Parse the remaining rows of a csv reader into columns keyed by header."""
+    positions = _column_positions(headers)
+    columns: Dict[str, List[str]] = {header: [] for header in positions}
+    
+    for row in reader:
+        values = [v.strip() for v in row]
+        # Skip blank and whitespace-only lines
+        if not values or values == ['']:
+            continue
+        if len(values) >= len(headers):
+            for header, indices in positions.items():
+                columns[header].append(values[indices[0]])
+        else:
+            # Short row: fill missing fields with '' so columns stay aligned
+            for header, indices in positions.items():
+                columns[header].append(_pick_value(values, indices))
+    
+    return columns
+
+
+def read_data_file(filepath: str) -> Dict[str, List[str]]:
+    """Read data from a CSV-like file and return it as columns keyed by header."""
     try:
-        with open(filepath, 'r') as f:
-            lines = f.readlines()
-            if not lines:
-                return records
+        with open(filepath, 'r', newline='') as f:
+            reader = csv.reader(f, skipinitialspace=True)
+            try:
+                headers = [h.strip() for h in next(reader)]
+            except StopIteration:
+                return {}
             
-            headers = [h.strip() for h in lines[0].split(',')]
+            # pandas pads short rows before we see them, so it cannot pick the
+            # last occurrence present in a row; repeated headers use csv instead
+            if pd is not None and len(set(headers)) == len(headers):
+                try:
+                    return _read_with_pandas(filepath, headers)
+                except pd.errors.ParserError:
+                    # Input pandas rejects, such as an unterminated quote, is
+                    # parsed by csv so both paths return the same data
+                    pass
             
-            for line in lines[1:]:
-                if line.strip():
-                    values = [v.strip() for v in line.split(',')]
-                    record = dict(zip(headers, values))
-                    records.append(record)
+            return _read_with_csv(reader, headers)
     except FileNotFoundError:
         print(f"Error: File '{filepath}' not found")
-        return []
+        return {}
     except Exception as e:
         print(f"Error reading file: {e}")
-        return []
-    
-    return records
+        return {}
 
 
-def calculate_statistics(data: List[Dict[str, str]], numeric_field: str) -> Tuple[float, float, float]:
-    """Calculate min, max, and average for a numeric field."""
-    values = []
+def count_records(columns: Dict[str, List[str]]) -> int:
+    """Return the number of records held in a columnar data set."""
+    return len(next(iter(columns.values()), []))
+
+
+def calculate_statistics(columns: Dict[str, List[str]], numeric_field: str) -> Tuple[float, float, float]:
+    """Calculate min, max, and average for a numeric field in a single pass."""
+    min_val = math.inf
+    max_val = -math.inf
+    total = 0.0
+    count = 0
     
-    for record in data:
-        if numeric_field in record:
-            try:
-                values.append(float(record[numeric_field]))
-            except ValueError:
-                continue
+    for value in columns.get(numeric_field, []):
+        try:
+            number = float(value)
+        except ValueError:
+            continue
+        if number < min_val:
+            min_val = number
+        if number > max_val:
+            max_val = number
+        total += number
+        count += 1
     
-    if not values:
+    if not count:
         return 0.0, 0.0, 0.0
     
-    min_val = min(values)
-    max_val = max(values)
-    avg_val = sum(values) / len(values)
-    
-    return min_val, max_val, avg_val
+    return min_val, max_val, total / count
+
+
+def select_rows(columns: Dict[str, List[str]], indices: Sequence[int]) -> Dict[str, List[str]]:
+    """Return the given rows of a columnar data set, preserving the columnar shape."""
+    return {header: [values[i] for i in indices] for header, values in columns.items()}
 
 
-def filter_by_category(data: List[Dict[str, str]], category_field: str, category_value: str) -> List[Dict[str, str]]:
-    """Filter records by a specific category value."""
-    return [record for record in data if record.get(category_field) == category_value]
+def filter_by_category(columns: Dict[str, List[str]], category_field: str, category_value: str) -> Dict[str, List[str]]:
+    """Filter records by a specific category value, returning the matching rows as columns."""
+    indices = [i for i, value in enumerate(columns.get(category_field, [])) if value == category_value]
+    return select_rows(columns, indices)
+
+
+def index_by_category(columns: Dict[str, List[str]], category_field: str) -> Dict[str, List[int]]:
+    """
+    Map each value of a category field to the indices of the rows holding it.
+    
+    Build this once when querying several categories; each lookup is then a
+    dict access instead of the full scan filter_by_category performs.
+    """
+    index: DefaultDict[str, List[int]] = defaultdict(list)
+    for i, value in enumerate(columns.get(category_field, [])):
+        index[value].append(i)
+    return dict(index)
 
 
 def main():
@@ -68,22 +171,23 @@ def main():
     
     filepath = sys.argv[1]
     data = read_data_file(filepath)
+    num_records = count_records(data)
     
-    if not data:
+    if not num_records:
         print("No data loaded")
         sys.exit(1)
     
-    print(f"Loaded {len(data)} records")
+    print(f"Loaded {num_records} records")
     
-    if 'amount' in data[0]:
+    if 'amount' in data:
         min_amt, max_amt, avg_amt = calculate_statistics(data, 'amount')
         print(f"\nAmount Statistics:")
         print(f"  Min: {min_amt:.2f}")
         print(f"  Max: {max_amt:.2f}")
         print(f"  Avg: {avg_amt:.2f}")
     
-    if 'category' in data[0]:
-        categories = set(record.get('category', '') for record in data)
+    if 'category' in data:
+        categories = set(data['category'])
         print(f"\nCategories found: {', '.join(sorted(categories))}")
 
 
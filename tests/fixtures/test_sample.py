@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Test script to verify sample.py parses CSV files the same way with and without pandas."""
+
+import os
+import sys
+import tempfile
+
+import sample
+
+# CSV inputs and the columns the pure-Python parser must return for them
+CASES = {
+    "trailing whitespace": (
+        "name, amount, category\na, 10 , food \nb, 20, tech\n",
+        {"name": ["a", "b"], "amount": ["10", "20"], "category": ["food", "tech"]},
+    ),
+    "extra field in one row": (
+        "name,amount,category\na, 10, food\nd, 7, food, extra\n",
+        {"name": ["a", "d"], "amount": ["10", "7"], "category": ["food", "food"]},
+    ),
+    "extra field in every row": (
+        "name,amount,category\na,10,food,x\nb,20,tech,y\n",
+        {"name": ["a", "b"], "amount": ["10", "20"], "category": ["food", "tech"]},
+    ),
+    "every row short": (
+        "name,amount,category\na,10\nb,20\n",
+        {"name": ["a", "b"], "amount": ["10", "20"], "category": ["", ""]},
+    ),
+    "short, full and extra rows": (
+        "name,amount,category\na,10\nb,20,tech\nc,30,food,extra\n",
+        {"name": ["a", "b", "c"], "amount": ["10", "20", "30"], "category": ["", "tech", "food"]},
+    ),
+    "blank and whitespace-only lines": (
+        "name,amount,category\na,10,food\n\n   \n\t\nb,20,tech\n",
+        {"name": ["a", "b"], "amount": ["10", "20"], "category": ["food", "tech"]},
+    ),
+    "duplicate headers": (
+        "a,a,b\n1,2,3\n4,5,6\n",
+        {"a": ["2", "5"], "b": ["3", "6"]},
+    ),
+    "duplicate headers with short rows": (
+        "a,a,b\n\ty\n1,,3\n7\n",
+        {"a": ["y", "", "7"], "b": ["", "3", ""]},
+    ),
+    "quoted comma": (
+        'name,amount\n"b, inc", 3\n',
+        {"name": ["b, inc"], "amount": ["3"]},
+    ),
+    "unterminated quote": (
+        'item,amount\n"open,5\nb,6\n',
+        {"item": ["open,5\nb,6"], "amount": [""]},
+    ),
+    "header only": (
+        "name,amount\n",
+        {"name": [], "amount": []},
+    ),
+    "empty file": (
+        "",
+        {},
+    ),
+}
+
+
+def _read(content, use_pandas):
+    """Write content to a temp file and parse it with or without pandas."""
+    saved_pd = sample.pd
+    if not use_pandas:
+        sample.pd = None
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    try:
+        with os.fdopen(fd, "w", newline="") as f:
+            f.write(content)
+        return sample.read_data_file(path)
+    finally:
+        sample.pd = saved_pd
+        os.remove(path)
+
+
+def test_fallback_parser():
+    """Test the pure-Python parser against the expected columns."""
+    print("Testing pure-Python parser...")
+
+    for name, (content, expected) in CASES.items():
+        result = _read(content, use_pandas=False)
+        assert result == expected, f"{name}: {result!r} != {expected!r}"
+        print(f"  ✓ {name}")
+
+    return True
+
+
+def test_pandas_matches_fallback():
+    """Test that the pandas path returns exactly what the pure-Python parser does."""
+    print("\nTesting pandas parser parity...")
+
+    if sample.pd is None:
+        print("  - pandas not installed, skipped")
+        return True
+
+    for name, (content, _) in CASES.items():
+        with_pandas = _read(content, use_pandas=True)
+        without_pandas = _read(content, use_pandas=False)
+        assert with_pandas == without_pandas, f"{name}: {with_pandas!r} != {without_pandas!r}"
+        print(f"  ✓ {name}")
+
+    return True
+
+
+if __name__ == "__main__":
+    print("=" * 60)
+    print("Testing sample.py CSV parsing")
+    print("=" * 60)
+
+    success = True
+    success = test_fallback_parser() and success
+    success = test_pandas_matches_fallback() and success
+
+    print("\n" + "=" * 60)
+    if success:
+        print("✓ All tests passed!")
+        print("=" * 60)
+        sys.exit(0)
+    else:
+        print("✗ Some tests failed")
+        print("=" * 60)
+        sys.exit(1)
@@ -1,10 +1,83 @@
 """Simple MCP server for testing Copilot CLI Extension MCP integration."""
 
+import json
+import re
+import threading
+from functools import lru_cache
+from typing import Any, Optional, Pattern, Sequence, Tuple
+
 from fastmcp import FastMCP
 
+try:
+    import hyperscan
+except ImportError:  # hyperscan is optional; the precompiled regexes are used instead
+    hyperscan = None
+
 # Initialize the MCP server
 mcp = FastMCP("hello-mcp")
 
+# Indicator patterns for validate_format, compiled once so each check is a single scan
+_MD_INDICATORS = ("#", "*", "-", "[", "]", "`")
+_CS_INDICATORS = ("class ", "namespace ", "using ", "public ", "private ", "{", "}", ";")
+
+
+def _compile_regex(indicators: Sequence[str]) -> Pattern[str]:
+    """Compiles literal indicators into one alternation regex."""
+    return re.compile("|".join(map(re.escape, indicators)))
+
+
+def _compile_hyperscan(indicators: Sequence[str]) -> Optional[Any]:
+    """Compiles literal indicators into a Hyperscan database, or None without hyperscan."""
+    if hyperscan is None:
+        return None
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[re.escape(ind).encode() for ind in indicators],
+        ids=list(range(len(indicators))),
+        flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(indicators),
+    )
+    return db
+
+
+# Hyperscan scratch space cannot be shared by concurrent scans, and FastMCP may
+# run sync tools on worker threads, so each thread allocates its own
+_hs_local = threading.local()
+
+
+def _scratch_for(db: Any) -> Any:
+    """Returns this thread's Hyperscan scratch space for db, allocating it on first use."""
+    scratches = getattr(_hs_local, "scratches", None)
+    if scratches is None:
+        scratches = _hs_local.scratches = {}
+    scratch = scratches.get(id(db))
+    if scratch is None:
+        scratch = scratches[id(db)] = hyperscan.Scratch(db)
+    return scratch
+
+
+def _contains_any(content: str, regex: Pattern[str], db: Optional[Any]) -> bool:
+    """Returns True if content contains any indicator, stopping at the first match."""
+    if db is None:
+        return regex.search(content) is not None
+    try:
+        # Returning True from the handler terminates the scan on the first match.
+        # surrogatepass keeps lone surrogates (valid in JSON strings) encodable.
+        db.scan(
+            content.encode("utf-8", "surrogatepass"),
+            match_event_handler=lambda *_: True,
+            scratch=_scratch_for(db),
+        )
+        return False
+    except hyperscan.ScanTerminated:
+        return True
+
+
+_MD_RE = _compile_regex(_MD_INDICATORS)
+_CS_RE = _compile_regex(_CS_INDICATORS)
+_MD_HS_DB = _compile_hyperscan(_MD_INDICATORS)
+_CS_HS_DB = _compile_hyperscan(_CS_INDICATORS)
+
+
 # Test data store
 TEST_DATA = {
     "sample": {
@@ -30,6 +103,8 @@ TEST_DATA = {
     }
 }
 
+_AVAILABLE_KEYS = ", ".join(TEST_DATA)
+
 
 @mcp.tool()
 def get_test_data(key: str) -> dict:
@@ -46,12 +121,54 @@ def get_test_data(key: str) -> dict:
         KeyError: If the key is not found in test data
     """
     if key not in TEST_DATA:
-        available_keys = ", ".join(TEST_DATA.keys())
-        raise KeyError(f"Key '{key}' not found. Available keys: {available_keys}")
+        raise KeyError(f"Key '{key}' not found. Available keys: {_AVAILABLE_KEYS}")
     
     return TEST_DATA[key]
 
 
+@lru_cache(maxsize=256)
+def _validate_parsed(content: str, format_type: str) -> Tuple[bool, str]:
+    """
+    Runs the JSON parse or Python compile for validate_format and returns (valid, details).
+    
+    Only these checks are memoized, since a parse or compile costs far more than
+    hashing the key. maxsize caps the number of cached entries, not their size.
+    """
+    if format_type == "json":
+        try:
+            json.loads(content)
+            return True, "Valid JSON structure"
+        except json.JSONDecodeError as e:
+            return False, f"Invalid JSON: {str(e)}"
+    
+    # Basic Python syntax check
+    try:
+        compile(content, '<string>', 'exec')
+        return True, "Valid Python syntax"
+    except SyntaxError as e:
+        return False, f"Python syntax error: {str(e)}"
+
+
+def _validate(content: str, format_type: str) -> Tuple[bool, str]:
+    """Runs the validation for validate_format and returns (valid, details)."""
+    if format_type in ("json", "python"):
+        return _validate_parsed(content, format_type)
+    
+    if format_type == "markdown":
+        # Simple markdown validation - check for common markdown elements
+        has_markdown = _contains_any(content, _MD_RE, _MD_HS_DB)
+        # isspace() answers "is there any non-whitespace?" without copying the string
+        valid = has_markdown or (bool(content) and not content.isspace())
+        return valid, "Contains markdown indicators" if has_markdown else "Plain text (valid as markdown)"
+    
+    if format_type == "csharp":
+        # Basic C# validation - check for common patterns
+        has_csharp = _contains_any(content, _CS_RE, _CS_HS_DB)
+        return has_csharp, "Contains C# code patterns" if has_csharp else "No C# patterns detected"
+    
+    return False, f"Unknown format type: {format_type}. Supported: markdown, python, json, csharp"
+
+
 @mcp.tool()
 def validate_format(content: str, format_type: str) -> dict:
     """
@@ -67,49 +184,13 @@ def validate_format(content: str, format_type: str) -> dict:
         - format: The format type that was checked
         - details: Additional details about validation
     """
-    import json
+    valid, details = _validate(content, format_type)
     
-    result = {
-        "valid": False,
+    return {
+        "valid": valid,
         "format": format_type,
-        "details": ""
+        "details": details
     }
-    
-    if format_type == "json":
-        try:
-            json.loads(content)
-            result["valid"] = True
-            result["details"] = "Valid JSON structure"
-        except json.JSONDecodeError as e:
-            result["details"] = f"Invalid JSON: {str(e)}"
-    
-    elif format_type == "markdown":
-        # Simple markdown validation - check for common markdown elements
-        markdown_indicators = ["#", "*", "-", "[", "]", "`"]
-        has_markdown = any(indicator in content for indicator in markdown_indicators)
-        result["valid"] = has_markdown or len(content.strip()) > 0
-        result["details"] = "Contains markdown indicators" if has_markdown else "Plain text (valid as markdown)"
-    
-    elif format_type == "python":
-        # Basic Python syntax check
-        try:
-            compile(content, '<string>', 'exec')
-            result["valid"] = True
-            result["details"] = "Valid Python syntax"
-        except SyntaxError as e:
-            result["details"] = f"Python syntax error: {str(e)}"
-    
-    elif format_type == "csharp":
-        # Basic C# validation - check for common patterns
-        csharp_indicators = ["class ", "namespace ", "using ", "public ", "private ", "{", "}", ";"]
-        has_csharp = any(indicator in content for indicator in csharp_indicators)
-        result["valid"] = has_csharp
-        result["details"] = "Contains C# code patterns" if has_csharp else "No C# patterns detected"
-    
-    else:
-        result["details"] = f"Unknown format type: {format_type}. Supported: markdown, python, json, csharp"
-    
-    return result
 
 
 if __name__ == "__main__":
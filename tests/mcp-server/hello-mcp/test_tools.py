@@ -73,6 +73,87 @@ def test_validate_format():
     return True
 
 
+# (content, has markdown indicator, has C# indicator)
+INDICATOR_CASES = [
+    ("# Header\n- List item", True, False),
+    ("public class Test { }", False, True),
+    ("plain text", False, False),
+    ("", False, False),
+    ("   \n\t", False, False),
+    # Lone surrogates are valid in JSON strings, so MCP arguments can carry them
+    (json.loads('"# hi \\ud800"'), True, False),
+    (json.loads('"int x; \\udc00"'), False, True),
+    (json.loads('"plain \\ud800"'), False, False),
+]
+
+
+def _check_indicators(label, md_db, cs_db):
+    """Run INDICATOR_CASES through _contains_any with the given databases."""
+    from server import _contains_any, _MD_RE, _CS_RE
+
+    for content, want_md, want_cs in INDICATOR_CASES:
+        got_md = _contains_any(content, _MD_RE, md_db)
+        got_cs = _contains_any(content, _CS_RE, cs_db)
+        assert (got_md, got_cs) == (want_md, want_cs), \
+            f"{label}: {content!r} gave markdown={got_md}, csharp={got_cs}"
+    print(f"  ✓ {label}")
+
+
+def test_contains_any():
+    """Test _contains_any with the regex and Hyperscan, including concurrent scans."""
+    import threading
+    import server
+
+    print("\nTesting _contains_any...")
+
+    _check_indicators("Regex path", None, None)
+
+    if server.hyperscan is None:
+        print("  - hyperscan not installed, Hyperscan paths skipped")
+        return True
+
+    _check_indicators("Hyperscan path", server._MD_HS_DB, server._CS_HS_DB)
+
+    # Each thread gets its own scratch space, reused across its scans
+    scratches = {}
+
+    def collect_scratch(name):
+        scratches[name] = (server._scratch_for(server._CS_HS_DB), server._scratch_for(server._CS_HS_DB))
+
+    threads = [threading.Thread(target=collect_scratch, args=(n,)) for n in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(a is b for a, b in scratches.values()), "scratch space not reused within a thread"
+    assert scratches[0][0] is not scratches[1][0], "scratch space shared across threads"
+    print("  ✓ Per-thread scratch space")
+
+    # Concurrent scans on one database must neither fail nor change results
+    hit = "x" * 200000 + ";"
+    miss = "x" * 200000
+    results = []
+
+    def worker():
+        for _ in range(100):
+            results.append(server._contains_any(hit, server._CS_RE, server._CS_HS_DB))
+            results.append(not server._contains_any(miss, server._CS_RE, server._CS_HS_DB))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # A scan that raised in a worker thread leaves results short
+    assert len(results) == 800, f"only {len(results)} of 800 concurrent scans completed"
+    assert all(results), "concurrent Hyperscan scans returned wrong results"
+    print("  ✓ Concurrent Hyperscan scans")
+
+    return True
+
+
 if __name__ == "__main__":
     print("=" * 60)
     print("Testing Hello MCP Server Functions")
@@ -81,6 +162,7 @@ if __name__ == "__main__":
     success = True
     success = test_get_test_data() and success
     success = test_validate_format() and success
+    success = test_contains_any() and success
     
     print("\n" + "=" * 60)
     if success: